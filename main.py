@@ -1,30 +1,284 @@
 import eventlet
 eventlet.monkey_patch() 
-from flask import Flask, jsonify, request # Added 'request' import
+from eventlet.semaphore import Semaphore
+from eventlet.green import socket as green_socket
+try:
+    from eventlet.support import greendns
+except ImportError:
+    greendns = None
+from flask import Flask, Response, jsonify, request # Added 'request' import
 from flask_cors import CORS
 
+import orjson
+import requests
 import yfinance as yf
-import pandas as pd
 from flask_socketio import SocketIO, emit
+import logging
+import os
+import sys
 import time # For time.sleep
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
 
 # Patch standard library for async operations with eventlet
 
 # --- Installation Instructions ---
 # If you don't have these installed, run these commands in your terminal:
-# pip install yfinance pandas Flask Flask-Cors Flask-SocketIO eventlet
+# pip install "yfinance>=0.2" requests orjson Flask Flask-Cors Flask-SocketIO eventlet dnspython
+
+# --- Logging ---
+# Per-symbol progress is logged at DEBUG and dropped at the default INFO level, so
+# the polling loop only writes its per-cycle summary and any errors.
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+log = logging.getLogger(__name__)
+
+# With green DNS, eventlet resolves Yahoo's hostnames without blocking the hub, so the
+# concurrent per-symbol fetches don't queue up behind each other's lookups. It is off
+# when dnspython is missing or EVENTLET_NO_GREENDNS=yes is set.
+if greendns is None or green_socket.getaddrinfo is not greendns.getaddrinfo:
+    log.warning("eventlet green DNS is not in use, DNS lookups will block the eventlet hub.")
 
 app = Flask(__name__)
 # Allow CORS for all origins and all routes for development purposes
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+class OrjsonSocketIOJSON:
+    """
+    json module replacement for Flask-SocketIO that encodes with orjson.
+    Socket.IO packets are text, so the encoded bytes are decoded to str.
+    """
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+# Seconds an idle HTTP keep-alive connection may hold a greenlet before it is closed
+HTTP_KEEPALIVE_TIMEOUT = 5
+
+# Optional Redis URL (e.g. redis://localhost:6379/0) shared by several server processes.
+# When set, a single broadcaster process (python main.py --broadcaster) publishes index
+# updates to the queue once and each server process fans them out to its own clients.
+message_queue = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+
 # Initialize Flask-SocketIO with eventlet as the async mode
 # cors_allowed_origins="*" allows connections from any origin, essential for client-side apps
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode="eventlet")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode="eventlet", json=OrjsonSocketIOJSON,
+                    message_queue=message_queue)
 
 # --- Global variable to control the background task loop ---
 # This will be used to stop the background task if needed (e.g., on server shutdown)
 thread_running = False
+# Guards the check-and-start in handle_connect so simultaneous connects can't
+# start the background task twice
+thread_lock = Semaphore()
+
+# --- Last index data sent to clients ---
+# Updates are only broadcast when the data changes; new clients are sent
+# this copy on connect so they don't wait for the next change.
+# With a message queue the server processes don't fetch the data themselves, so
+# the broadcaster also stores it in Redis under INDICES_STORE_KEY for them to read.
+last_indices_data = None
+INDICES_STORE_KEY = 'live-sensex:indices'
+if message_queue is not None:
+    import redis
+    indices_store = redis.Redis.from_url(message_queue)
+else:
+    indices_store = None
+
+def save_indices_data(indices_data):
+    """
+    Records the index data that was just broadcast.
+    """
+    global last_indices_data
+    last_indices_data = indices_data
+    if indices_store is not None:
+        try:
+            indices_store.set(INDICES_STORE_KEY, orjson.dumps(indices_data))
+        except redis.RedisError as e:
+            log.error("Error storing index data in Redis: %s", e)
+
+def load_indices_data():
+    """
+    Returns the last broadcast index data, or None if there is none or it
+    couldn't be read.
+    """
+    if indices_store is None:
+        return last_indices_data
+    try:
+        payload = indices_store.get(INDICES_STORE_KEY)
+    except redis.RedisError as e:
+        log.error("Error reading index data from Redis: %s", e)
+        return None
+    return orjson.loads(payload) if payload is not None else None
+
+# --- HTTP session for the batch quote requests ---
+# Keeps the connection to Yahoo open between requests, so each one skips the TCP
+# and TLS handshakes, and holds the Yahoo cookie. yfinance manages its own
+# session, so this one is not passed to yf.Ticker.
+http_session = requests.Session()
+
+# --- Yahoo Finance batch quote endpoint ---
+# One HTTP request returns quotes for every symbol in the chunk, instead of one
+# scrape of ticker.info per symbol.
+# Yahoo only answers quote requests that carry a session cookie and the matching
+# 'crumb' token, so both are fetched once and reused until Yahoo rejects them.
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_COOKIE_URL = "https://fc.yahoo.com"
+QUOTE_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+QUOTE_BATCH_SIZE = 10 # Keep symbol lists short, Yahoo rejects overly long ones
+QUOTE_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+QUOTE_RETRY_AFTER = 300 # Seconds to skip the endpoint for after a failed request
+quote_crumb = None
+quote_failed_at = None
+
+def get_quote_crumb(refresh=False):
+    """
+    Returns the crumb to send with quote requests.
+    On the first call, or when refresh is set, fetches a new session cookie
+    into http_session and the crumb tied to it.
+    """
+    global quote_crumb
+    if quote_crumb is None or refresh:
+        # The response is a 404 page, only the cookie it sets matters
+        http_session.get(QUOTE_COOKIE_URL, headers=QUOTE_HEADERS, timeout=10)
+        response = http_session.get(QUOTE_CRUMB_URL, headers=QUOTE_HEADERS, timeout=10)
+        response.raise_for_status()
+        quote_crumb = response.text
+    return quote_crumb
+
+def request_quotes(symbols, refresh_auth=False):
+    """
+    Sends one batch quote request for the comma-separated symbols.
+    """
+    crumb = get_quote_crumb(refresh=refresh_auth)
+    return http_session.get(QUOTE_URL, params={'symbols': symbols, 'crumb': crumb},
+                            headers=QUOTE_HEADERS, timeout=10)
+
+def fetch_batch_quotes(symbols):
+    """
+    Fetches quotes for the given symbols from Yahoo's batch quote endpoint,
+    one HTTP request per chunk of QUOTE_BATCH_SIZE symbols.
+    Returns a dict mapping each symbol to its quote. If a request fails, the
+    quotes fetched so far are returned and the endpoint is skipped for the
+    next QUOTE_RETRY_AFTER seconds.
+    """
+    global quote_failed_at
+    quotes = {}
+    if quote_failed_at is not None and time.monotonic() - quote_failed_at < QUOTE_RETRY_AFTER:
+        return quotes
+
+    try:
+        for i in range(0, len(symbols), QUOTE_BATCH_SIZE):
+            chunk = ','.join(symbols[i:i + QUOTE_BATCH_SIZE])
+            response = request_quotes(chunk)
+            if response.status_code == 401:
+                # The cookie or crumb expired, get new ones and retry once
+                response = request_quotes(chunk, refresh_auth=True)
+            response.raise_for_status()
+            for quote in response.json()['quoteResponse']['result']:
+                quotes[quote['symbol']] = quote
+    except Exception as e:
+        log.warning("Batch quote endpoint unavailable, skipping it for %s seconds: %s", QUOTE_RETRY_AFTER, e)
+        quote_failed_at = time.monotonic()
+    return quotes
+
+@lru_cache(maxsize=256)
+def get_long_name(symbol):
+    """
+    Returns the company name for the symbol from ticker.info.
+    Names don't change, so each symbol is looked up once per process.
+    Failed lookups raise and are not cached, so they are retried next time.
+    """
+    return yf.Ticker(symbol).info.get('longName', 'N/A')
+
+def fetch_ticker_quote(symbol, with_name=False):
+    """
+    Fetches a single symbol through yfinance and returns it in the same shape
+    as a batch quote. Prices come from ticker.fast_info; the company name is
+    only looked up when with_name is set.
+    """
+    # A new Ticker is built for every fetch on purpose: fast_info keeps the prices
+    # it loaded, so a reused Ticker would return the same prices on every poll,
+    # and yfinance already shares one HTTP session between all Tickers
+    fast_info = yf.Ticker(symbol).fast_info
+    quote = {
+        'symbol': symbol,
+        'regularMarketPrice': fast_info.last_price,
+        'regularMarketPreviousClose': fast_info.regular_market_previous_close,
+    }
+    if with_name:
+        try:
+            quote['longName'] = get_long_name(symbol)
+        except Exception as e:
+            log.warning("Error fetching company name for %s: %s", symbol, e)
+            quote['longName'] = 'N/A'
+    return quote
+
+def fetch_quotes(symbols, with_names=False):
+    """
+    Returns a dict mapping each symbol to its quote.
+    Uses the batch quote endpoint, and fetches the symbols it didn't return
+    concurrently through yfinance.
+    Company names are only looked up in the fallback when with_names is set.
+    Symbols that could not be fetched are left out of the result.
+    """
+    quotes = fetch_batch_quotes(symbols)
+    missing = [symbol for symbol in symbols if symbol not in quotes]
+    if not missing:
+        return quotes
+
+    def fetch_one(symbol):
+        try:
+            return symbol, fetch_ticker_quote(symbol, with_name=with_names)
+        except Exception as e:
+            log.error("Error fetching data for %s: %s", symbol, e)
+            return symbol, None
+
+    # eventlet's monkey patching turns the pool's threads into greenlets, so the
+    # requests overlap on socket I/O and the total wait is the slowest symbol
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        for symbol, quote in executor.map(fetch_one, missing):
+            if quote is not None:
+                quotes[symbol] = quote
+    return quotes
+
+# --- Response cache for the /stock route ---
+# Holds the serialized JSON body of the last response that had any prices, so
+# repeated requests within STOCK_CACHE_TTL seconds don't hit Yahoo again.
+STOCK_CACHE_TTL = 15
+stock_cache = {'ts': 0, 'payload': None}
+# Lets only one request at a time refresh the cache
+stock_cache_lock = Semaphore()
+
+def get_cached_stock_response():
+    """
+    Returns the cached /stock response, or None if there is none or it expired.
+    """
+    if stock_cache['payload'] is not None and time.monotonic() - stock_cache['ts'] < STOCK_CACHE_TTL:
+        return Response(stock_cache['payload'], mimetype='application/json')
+    return None
+
+# --- Polling cadence for the indices background task ---
+# BSE/NSE trade 09:15-15:30 IST, Monday to Friday. Outside those hours prices
+# don't move, so the task polls much less often.
+MARKET_TZ = timezone(timedelta(hours=5, minutes=30), 'IST') # IST has no daylight saving
+MARKET_OPEN = dt_time(9, 15)
+MARKET_CLOSE = dt_time(15, 30)
+MARKET_OPEN_INTERVAL = 15 # seconds
+MARKET_CLOSED_INTERVAL = 300 # seconds
+
+def get_poll_interval():
+    """
+    Returns how many seconds to wait before the next index fetch.
+    """
+    now = datetime.now(MARKET_TZ)
+    if now.weekday() < 5 and MARKET_OPEN <= now.time() <= MARKET_CLOSE:
+        return MARKET_OPEN_INTERVAL
+    return MARKET_CLOSED_INTERVAL
 
 # --- Function to fetch and emit index data periodically ---
 def fetch_and_emit_indices():
@@ -32,9 +286,7 @@ def fetch_and_emit_indices():
     Fetches live Sensex and Nifty 50 index values and emits them via WebSocket.
     This function runs as a background task.
     """
-    global thread_running
-    thread_running = True
-    
+
     index_symbols = {
         'Sensex': '^BSESN',  # BSE Sensex
         'Nifty 50': '^NSEI'  # NSE Nifty 50
@@ -42,44 +294,16 @@ def fetch_and_emit_indices():
 
     while thread_running:
         indices_data = []
-        print("--- Fetching Live Indian Index Data (Sensex, Nifty) for WebSocket ---")
+        log.debug("--- Fetching Live Indian Index Data (Sensex, Nifty) for WebSocket ---")
 
-        for name, symbol in index_symbols.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                # Use .info to get comprehensive current data
-                info = ticker.info 
-
-                # Yahoo Finance's 'regularMarketPrice' is generally the most up-to-date
-                # price during market hours. 'currentPrice' can also work but 'regularMarketPrice'
-                # is often more reliable for live data.
-                current_price = info.get('regularMarketPrice') 
-                previous_close = info.get('previousClose')
-
-                change = 'N/A'
-                change_percent = 'N/A'
-                change_percent_formatted = 'N/A'
-
-                if current_price is not None and previous_close is not None and previous_close != 0:
-                    change = round(current_price - previous_close, 2)
-                    change_percent = round((change / previous_close) * 100, 2)
-                    change_percent_formatted = f"{'+' if change_percent > 0 else ''}{change_percent}%"
-                elif current_price is not None:
-                    # If previous_close is 0 or None, we can still show current price but no change
-                    change = "N/A"
-                    change_percent = "N/A"
-                    change_percent_formatted = "N/A"
+        # Both indices are fetched in a single request
+        quotes = fetch_quotes(list(index_symbols.values()))
 
-                indices_data.append({
-                    'Name': name,
-                    'Symbol': symbol,
-                    'Price': current_price,
-                    'Change': change,
-                    'Change %': change_percent_formatted
-                })
-                print(f"Fetched data for index: {name} ({symbol})")
-            except Exception as e:
-                print(f"Error fetching data for index {name} ({symbol}): {e}")
+        # fetch_quotes handles its own errors; symbols missing from the result get error rows
+        for name, symbol in index_symbols.items():
+            quote = quotes.get(symbol)
+            if quote is None:
+                log.error("No data returned for index %s (%s)", name, symbol)
                 indices_data.append({
                     'Name': name,
                     'Symbol': symbol,
@@ -87,17 +311,50 @@ def fetch_and_emit_indices():
                     'Change': 'N/A',
                     'Change %': 'N/A'
                 })
+                continue
+
+            # Yahoo Finance's 'regularMarketPrice' is generally the most up-to-date
+            # price during market hours.
+            current_price = quote.get('regularMarketPrice')
+            previous_close = quote.get('regularMarketPreviousClose')
+
+            change = 'N/A'
+            change_percent = 'N/A'
+            change_percent_formatted = 'N/A'
+
+            if current_price is not None and previous_close is not None and previous_close != 0:
+                change = round(current_price - previous_close, 2)
+                change_percent = round((change / previous_close) * 100, 2)
+                change_percent_formatted = format(change_percent, '+.2f') + '%'
+            elif current_price is not None:
+                # If previous_close is 0 or None, we can still show current price but no change
+                change = "N/A"
+                change_percent = "N/A"
+                change_percent_formatted = "N/A"
+
+            indices_data.append({
+                'Name': name,
+                'Symbol': symbol,
+                'Price': current_price,
+                'Change': change,
+                'Change %': change_percent_formatted
+            })
+            log.debug("Fetched data for index: %s (%s)", name, symbol)
         
-        # Emit the data to all connected clients under the 'indices_update' event
-        if indices_data:
+        # Emit the data to all connected clients under the 'indices_update' event,
+        # skipping the broadcast when nothing changed since the last one
+        if indices_data == last_indices_data:
+            log.debug("Index data unchanged, skipped indices_update.")
+        elif indices_data:
             socketio.emit('indices_update', indices_data)
-            print("Emitted indices_update to clients.")
+            save_indices_data(indices_data)
+            log.info("Emitted indices_update to clients.")
         else:
-            print("No index data to emit.")
+            log.warning("No index data to emit.")
             socketio.emit('indices_update', [{"message": "No index data could be retrieved."}])
 
-        # Wait for 15 seconds before fetching again
-        eventlet.sleep(15) # Use eventlet.sleep for non-blocking sleep
+        # Wait 15 seconds during market hours, 5 minutes otherwise
+        eventlet.sleep(get_poll_interval()) # Use eventlet.sleep for non-blocking sleep
 
 # --- Flask Routes ---
 
@@ -124,11 +381,27 @@ def home():
 
 @app.route('/stock')
 def get_indian_stock_performance_route(): # Renamed for clarity from _1
+    """
+    Returns current stock performance data for a predefined list of Indian stock symbols,
+    cached for STOCK_CACHE_TTL seconds.
+    """
+    response = get_cached_stock_response()
+    if response is None:
+        # Requests that miss the cache while another one is refreshing it wait
+        # for that refresh and are served its result
+        with stock_cache_lock:
+            response = get_cached_stock_response()
+            if response is None:
+                response = fetch_stock_performance()
+    return response
+
+def fetch_stock_performance():
     """
     Fetches current stock performance data for a predefined list of Indian stock symbols.
-    Returns the data as a JSON array, sorted by percentage change (gainers first).
+    Returns the data as a JSON array, sorted by percentage change (gainers first),
+    and caches it unless no stock could be priced.
     """
-    print("--- Fetching Current Stock Data for Selected Indian Companies (HTTP request) ---")
+    log.debug("--- Fetching Current Stock Data for Selected Indian Companies (HTTP request) ---")
 
     all_stock_data = []
     symbols = [
@@ -144,58 +417,67 @@ def get_indian_stock_performance_route(): # Renamed for clarity from _1
         'AMZN',          # Example of a US stock (will be fetched if available)
     ]
 
-    for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+    # Symbols are fetched in chunks of QUOTE_BATCH_SIZE, one request per chunk
+    quotes = fetch_quotes(symbols, with_names=True)
 
-            company_name = info.get('longName', 'N/A')
-            current_price = info.get('currentPrice')
-            previous_close = info.get('previousClose')
-
-            change = 'N/A'
-            change_percent = 'N/A'
-            change_percent_formatted = 'N/A'
-            change_numeric = -float('inf') # Default for sorting errors to bottom
-
-            if current_price is not None and previous_close is not None and previous_close != 0:
-                change = round(current_price - previous_close, 2)
-                change_percent = round((change / previous_close) * 100, 2)
-                change_percent_formatted = f"{'+' if change_percent > 0 else ''}{change_percent}%"
-                change_numeric = change_percent # Use numeric for sorting
-            elif current_price is not None:
-                change = "N/A"
-                change_percent = "N/A"
-                change_percent_formatted = "N/A"
-                change_numeric = 0 # Treat as no change for sorting if only current price is available
-            else:
-                company_name = "N/A (Data Unavailable)"
-                change_percent_formatted = "N/A"
-
-            all_stock_data.append({
-                'Company': company_name,
-                'Symbol': symbol,
-                'Price': current_price,
-                'Change': change,
-                'ChangeP': change_percent_formatted,
-                'Change_Numeric': change_numeric
-            })
-            print(f"Fetched data for {symbol}")
-        except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
+    # fetch_quotes handles its own errors; symbols missing from the result get error rows
+    for symbol in symbols:
+        quote = quotes.get(symbol)
+        if quote is None:
+            log.error("No data returned for %s", symbol)
             all_stock_data.append({
                 'Company': 'Error',
                 'Symbol': symbol,
                 'Price': 'N/A',
                 'Change': 'N/A',
-                'Change %': 'N/A',
+                'ChangeP': 'N/A',
                 'Change_Numeric': -float('inf')
             })
+            continue
+
+        company_name = quote.get('longName', 'N/A')
+        current_price = quote.get('regularMarketPrice')
+        previous_close = quote.get('regularMarketPreviousClose')
+
+        change = 'N/A'
+        change_percent = 'N/A'
+        change_percent_formatted = 'N/A'
+        change_numeric = -float('inf') # Default for sorting errors to bottom
+
+        if current_price is not None and previous_close is not None and previous_close != 0:
+            change = round(current_price - previous_close, 2)
+            change_percent = round((change / previous_close) * 100, 2)
+            change_percent_formatted = format(change_percent, '+.2f') + '%'
+            change_numeric = change_percent # Use numeric for sorting
+        elif current_price is not None:
+            change = "N/A"
+            change_percent = "N/A"
+            change_percent_formatted = "N/A"
+            change_numeric = 0 # Treat as no change for sorting if only current price is available
+        else:
+            company_name = "N/A (Data Unavailable)"
+            change_percent_formatted = "N/A"
+
+        all_stock_data.append({
+            'Company': company_name,
+            'Symbol': symbol,
+            'Price': current_price,
+            'Change': change,
+            'ChangeP': change_percent_formatted,
+            'Change_Numeric': change_numeric
+        })
+        log.debug("Fetched data for %s", symbol)
 
     if all_stock_data:
-        df = pd.DataFrame(all_stock_data)
-        df_sorted = df.sort_values(by='Change_Numeric', ascending=False).drop(columns=['Change_Numeric'])
-        return jsonify(df_sorted.to_dict(orient='records'))
+        # Don't cache a response in which every fetch failed
+        has_prices = any(stock['Price'] not in (None, 'N/A') for stock in all_stock_data)
+        all_stock_data.sort(key=lambda stock: stock['Change_Numeric'], reverse=True)
+        for stock in all_stock_data:
+            del stock['Change_Numeric']
+        payload = orjson.dumps(all_stock_data)
+        if has_prices:
+            stock_cache.update(ts=time.monotonic(), payload=payload)
+        return Response(payload, mimetype='application/json')
     else:
         return jsonify({"message": "No stock data could be retrieved."}), 500
 
@@ -205,28 +487,48 @@ def get_indian_stock_performance_route(): # Renamed for clarity from _1
 def handle_connect():
     """
     Handles new WebSocket connections.
-    Starts the background task to emit indices data if it's not already running.
+    Sends the client the latest indices data, and starts the background task
+    to emit indices data if it's not already running. With a message queue the
+    separate broadcaster process emits the data instead.
     """
     global thread_running
-    print('Client connected:', request.sid) # 'request' is now imported
+    log.debug('Client connected: %s', request.sid) # 'request' is now imported
+    indices_data = load_indices_data()
+    if indices_data is not None:
+        emit('indices_update', indices_data)
     # Start the background task only if it's not already running
-    if not thread_running:
-        socketio.start_background_task(target=fetch_and_emit_indices)
-        print("Started background task for indices updates.")
+    with thread_lock:
+        if message_queue is None and not thread_running:
+            thread_running = True
+            socketio.start_background_task(target=fetch_and_emit_indices)
+            log.info("Started background task for indices updates.")
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """
     Handles WebSocket disconnections.
     """
-    print('Client disconnected:', request.sid)
+    log.debug('Client disconnected: %s', request.sid)
     # You might want to add logic here to stop the background task if no clients are connected,
     # but for simplicity, we'll let it run. In a real app, you'd manage this more carefully.
 
 
 # --- Run the Flask-SocketIO application ---
 if __name__ == '__main__':
+    if '--broadcaster' in sys.argv:
+        # Publish index updates to the message queue for the server processes to fan out
+        if message_queue is None:
+            sys.exit("--broadcaster requires SOCKETIO_MESSAGE_QUEUE to be set")
+        log.info("Starting indices broadcaster...")
+        thread_running = True
+        fetch_and_emit_indices()
+        sys.exit()
+
     # Use socketio.run() instead of app.run() when using Flask-SocketIO
     # Set debug=False and use_reloader=False to avoid issues with background tasks on some OS/environments
-    print("Starting Flask-SocketIO server...")
-    socketio.run(app, debug=False, use_reloader=False, allow_unsafe_werkzeug=True)
+    # Extra keyword arguments are passed through to eventlet.wsgi.server:
+    # keepalive closes idle HTTP keep-alive connections after a few seconds so they free
+    # their greenlet, while socket_timeout=None leaves open WebSocket connections alone
+    log.info("Starting Flask-SocketIO server...")
+    socketio.run(app, debug=False, use_reloader=False, allow_unsafe_werkzeug=True,
+                 keepalive=HTTP_KEEPALIVE_TIMEOUT, socket_timeout=None)